@@ -6,6 +6,7 @@ from datetime import date
 from utils import db_utils
 from utils.pdf_utils import generate_bill_pdf
 from utils.report_utils import get_sales_report, get_top_items
+from utils.kot_utils import get_open_tickets, ack_tickets, bump_ticket
 
 # ---------------------------
 # INIT
@@ -74,9 +75,9 @@ st.subheader("Menu")
 st.dataframe(menu_df, use_container_width=True)
 
 # ---------------------------
-# TABS: Billing | Reports
+# TABS: Billing | Reports | Kitchen
 # ---------------------------
-tab1, tab2 = st.tabs(["🧾 Billing", "📊 Reports"])
+tab1, tab2, tab3 = st.tabs(["🧾 Billing", "📊 Reports", "👨‍🍳 Kitchen"])
 
 # ---------------- BILLING TAB ----------------
 with tab1:
@@ -225,4 +226,42 @@ with tab2:
             data=top_csv,
             file_name=f"top_items_{start_s}to{end_s}.csv",
             mime="text/csv"
-        )
\ No newline at end of file
+        )
+
+# ---------------- KITCHEN TAB ----------------
+KITCHEN_REFRESH_SECONDS = 2
+
+@st.fragment(run_every=KITCHEN_REFRESH_SECONDS)
+def show_station_tickets(station):
+    """Station display, re-polled on a timer so new tickets show up without a click"""
+    seen_key = f"kot_seen_{station}"
+    seen_ids = st.session_state.get(seen_key, [])
+
+    tickets = get_open_tickets(station)
+    new_ids = [t["id"] for t in tickets if t["status"] == "NEW"]
+
+    # Only ack the NEW tickets the station was actually shown on the last render
+    if new_ids:
+        st.caption(f"{len(new_ids)} new ticket(s)")
+        if st.button("Acknowledge new tickets", key=f"ack_{station}"):
+            ack_tickets(seen_ids)
+            st.session_state[seen_key] = []
+            st.rerun(scope="fragment")
+    st.session_state[seen_key] = new_ids
+
+    if not tickets:
+        st.info("No open tickets.")
+    for t in tickets:
+        colK1, colK2 = st.columns([4, 1])
+        with colK1:
+            st.write(f"*#{t['id']}* · Order {t['order_id']} · {t['qty']} × {t['item_name']} ({t['status']})")
+        with colK2:
+            if st.button("Bump", key=f"bump_{t['id']}"):
+                bump_ticket(t["id"])
+                st.rerun(scope="fragment")
+
+with tab3:
+    st.subheader("Kitchen Order Tickets")
+    stations = sorted(set(db_utils.STATION_BY_CATEGORY.values()))
+    station = st.radio("Station", stations, horizontal=True)
+    show_station_tickets(station)
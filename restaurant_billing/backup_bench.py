@@ -0,0 +1,95 @@
+# backup_bench.py
+#
+# Checks that order entry stays fast while an online backup of a large
+# synthetic database runs. Exits non-zero if p95 latency during the backup
+# goes over --max-p95-ms. Runs against a throwaway database, never db/restaurant.db.
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from utils import backup_utils, db_utils
+
+
+def build_db(n_orders, lines_per_order=4):
+    db_utils.DB_PATH = os.path.join(tempfile.mkdtemp(), "backup_bench.db")
+    db_utils.init_db()
+    conn = db_utils.get_connection()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executemany(
+        "INSERT INTO menu (name, category, price, gst_percent) VALUES (?, ?, ?, 0.05)",
+        [(f"Menu Item {i}", "Food", 100.0) for i in range(100)],
+    )
+    now = datetime.now().isoformat()
+    conn.executemany(
+        "INSERT INTO orders (mode, subtotal, gst_amount, discount_amount, total_amount, payment_method, created_at) "
+        "VALUES ('DINE_IN', 0, 0, 0, 0, 'CASH', ?)",
+        [(now,)] * n_orders,
+    )
+    conn.executemany(
+        "INSERT INTO order_items (order_id, item_id, qty, unit_price, line_total) VALUES (?, ?, 1, 100.0, 100.0)",
+        [(i // lines_per_order + 1, i % 100 + 1) for i in range(n_orders * lines_per_order)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def enter_orders(stop, latencies, interval):
+    while not stop.is_set():
+        t = time.perf_counter()
+        order_id = db_utils.begin_order("DINE_IN")
+        db_utils.add_item(order_id, 1, 2)
+        latencies.append(time.perf_counter() - t)
+        time.sleep(interval)
+
+
+def summary(latencies):
+    lat = sorted(latencies)
+    p95 = lat[int(0.95 * (len(lat) - 1))]
+    return f"{len(lat):>5} orders | p50 {lat[len(lat) // 2] * 1000:6.1f} ms | p95 {p95 * 1000:6.1f} ms | max {lat[-1] * 1000:6.1f} ms", p95
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order-entry latency during an online backup.")
+    parser.add_argument("--orders", type=int, default=250000, help="Orders in the synthetic database")
+    parser.add_argument("--interval", type=float, default=0.01, help="Pause between cashier orders (s)")
+    parser.add_argument("--max-p95-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    print(f"Building synthetic database with {args.orders} orders...")
+    build_db(args.orders)
+    print(f"Database size: {os.path.getsize(db_utils.DB_PATH) / 1e6:.1f} MB")
+
+    # Baseline: order entry with no backup running
+    baseline = []
+    stop = threading.Event()
+    cashier = threading.Thread(target=enter_orders, args=(stop, baseline, args.interval))
+    cashier.start()
+    time.sleep(2.0)
+    stop.set()
+    cashier.join()
+
+    # Same load while a paced backup runs
+    during = []
+    stop = threading.Event()
+    cashier = threading.Thread(target=enter_orders, args=(stop, during, args.interval))
+    cashier.start()
+    t = time.perf_counter()
+    snapshot = backup_utils.backup_db(os.path.join(os.path.dirname(db_utils.DB_PATH), "backups"))
+    backup_secs = time.perf_counter() - t
+    stop.set()
+    cashier.join()
+
+    base_line, _ = summary(baseline)
+    during_line, p95 = summary(during)
+    print(f"Backup took {backup_secs:.2f}s -> {snapshot}")
+    print(f"  no backup     {base_line}")
+    print(f"  during backup {during_line}")
+
+    if p95 * 1000 > args.max_p95_ms:
+        print(f"❌ p95 order-entry latency above {args.max_p95_ms:.0f} ms")
+        raise SystemExit(1)
+    print(f"✅ p95 order-entry latency within {args.max_p95_ms:.0f} ms")
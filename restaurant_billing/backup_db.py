@@ -0,0 +1,40 @@
+# backup_db.py
+
+import argparse
+
+from utils import backup_utils
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Online backup and restore of the billing database.")
+    parser.add_argument("--dir", default=backup_utils.BACKUP_DIR, help="Snapshot directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_backup = sub.add_parser("backup", help="Take a snapshot of the live database")
+    p_backup.add_argument("--pages", type=int, default=256, help="Pages copied per step")
+    p_backup.add_argument("--pause", type=float, default=0.005, help="Seconds to pause between steps")
+    p_backup.add_argument("--keep", type=int, default=7, help="Snapshots to keep (0 = all)")
+
+    sub.add_parser("list", help="List snapshots")
+
+    p_verify = sub.add_parser("verify", help="Integrity-check a snapshot")
+    p_verify.add_argument("snapshot")
+
+    p_restore = sub.add_parser("restore", help="Restore the live database from a snapshot")
+    p_restore.add_argument("snapshot")
+
+    args = parser.parse_args()
+
+    if args.command == "backup":
+        path = backup_utils.backup_db(args.dir, pages=args.pages, pause=args.pause, keep=args.keep)
+        print(f"✅ Snapshot saved: {path}")
+    elif args.command == "list":
+        for path in backup_utils.list_snapshots(args.dir):
+            print(path)
+    elif args.command == "verify":
+        ok = backup_utils.check_integrity(args.snapshot)
+        print("✅ Snapshot OK" if ok else "❌ Snapshot is corrupt")
+        raise SystemExit(0 if ok else 1)
+    elif args.command == "restore":
+        previous = backup_utils.restore_db(args.snapshot, args.dir)
+        print(f"✅ Restored from {args.snapshot}")
+        print(f"Previous database saved as {previous}")
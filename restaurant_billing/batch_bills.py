@@ -0,0 +1,32 @@
+# batch_bills.py
+
+import argparse
+from datetime import date
+
+from utils.batch_utils import generate_bills_batch
+
+if __name__ == "__main__":
+    today = date.today().strftime("%Y-%m-%d")
+    parser = argparse.ArgumentParser(description="Regenerate bill PDFs and the sales report for a date range.")
+    parser.add_argument("--start", default=today, help="Start date (YYYY-MM-DD), default today")
+    parser.add_argument("--end", default=None, help="End date (YYYY-MM-DD), default same as start")
+    parser.add_argument("--out", default="bills", help="Directory to save bill PDFs")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--zip", dest="zip_path", default=None, help="Also bundle all PDFs into this ZIP file")
+    parser.add_argument("--report", default="sales_report.pdf", help="Sales report PDF path")
+    parser.add_argument("--no-report", action="store_true", help="Skip the sales report PDF")
+    args = parser.parse_args()
+
+    end = args.end or args.start
+    print(f"Generating bills from {args.start} to {end}...")
+    stats = generate_bills_batch(
+        args.start, end,
+        save_dir=args.out,
+        workers=args.workers,
+        zip_path=args.zip_path,
+        report_path=None if args.no_report else args.report,
+    )
+    print(f"✅ {stats['bills']} bills in {stats['elapsed']:.2f}s "
+          f"({stats['bills_per_sec']:.1f} bills/sec)")
+    if not args.no_report:
+        print(f"✅ Sales report: {args.report} in {stats['report_elapsed']:.2f}s")
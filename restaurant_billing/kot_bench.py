@@ -0,0 +1,90 @@
+# kot_bench.py
+#
+# Measures line-to-station latency of the KOT pipeline: a cashier thread adds
+# order lines at a fixed rate while one poller per station picks them up.
+# Runs against a throwaway database, never db/restaurant.db.
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from utils import db_utils, kot_utils
+
+SAMPLE_ITEMS = [
+    ("Margherita Pizza", "Food", 120.0, 0.05),
+    ("Veg Burger", "Food", 80.0, 0.05),
+    ("French Fries", "Snacks", 60.0, 0.05),
+    ("Cold Coffee", "Beverages", 50.0, 0.05),
+    ("Coca Cola", "Beverages", 40.0, 0.05),
+]
+
+
+def station_worker(station, stop, poll_interval, latencies):
+    cursor = 0
+    while True:
+        stopping = stop.is_set()
+        tickets, cursor = kot_utils.poll_station(station, after_id=cursor)
+        received = datetime.now()
+        for t in tickets:
+            latencies.append((received - datetime.fromisoformat(t["created_at"])).total_seconds())
+        kot_utils.ack_tickets([t["id"] for t in tickets])
+        if stopping and not tickets:
+            break
+        if not tickets:
+            time.sleep(poll_interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark KOT line-to-station latency.")
+    parser.add_argument("--lines-per-min", type=int, default=600)
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds to run")
+    parser.add_argument("--poll-interval", type=float, default=0.05, help="Station poll interval (s)")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp()
+    db_utils.DB_PATH = os.path.join(tmpdir, "kot_bench.db")
+    db_utils.init_db()
+    conn = db_utils.get_connection()
+    conn.executemany("INSERT INTO menu (name, category, price, gst_percent) VALUES (?, ?, ?, ?)", SAMPLE_ITEMS)
+    conn.commit()
+    conn.close()
+
+    stations = sorted(set(db_utils.STATION_BY_CATEGORY.values()))
+    latencies = {s: [] for s in stations}
+    stop = threading.Event()
+    workers = [
+        threading.Thread(target=station_worker, args=(s, stop, args.poll_interval, latencies[s]))
+        for s in stations
+    ]
+    for w in workers:
+        w.start()
+
+    interval = 60.0 / args.lines_per_min
+    order_id = None
+    sent = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < args.duration:
+        if sent % 4 == 0:
+            order_id = db_utils.begin_order("DINE_IN")
+        db_utils.add_item(order_id, sent % len(SAMPLE_ITEMS) + 1, 1)
+        sent += 1
+        next_at = start + sent * interval
+        time.sleep(max(0.0, next_at - time.perf_counter()))
+
+    stop.set()
+    for w in workers:
+        w.join()
+
+    print(f"Sent {sent} lines at {args.lines_per_min} lines/min, poll interval {args.poll_interval * 1000:.0f} ms")
+    for s in stations:
+        lat = sorted(latencies[s])
+        if not lat:
+            print(f"  {s:<6} no tickets")
+            continue
+        p95 = lat[int(0.95 * (len(lat) - 1))]
+        print(f"  {s:<6} {len(lat):>5} tickets | p50 {statistics.median(lat) * 1000:6.1f} ms"
+              f" | p95 {p95 * 1000:6.1f} ms | max {lat[-1] * 1000:6.1f} ms")
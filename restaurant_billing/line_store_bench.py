@@ -0,0 +1,121 @@
+# line_store_bench.py
+#
+# Compares the memory held by every order line in a range, loaded four ways:
+# a pandas DataFrame (as in the PDF item query), a list of dicts (as in
+# items_for_pdf), a list of slotted OrderLine records (what
+# batch_utils.iter_orders_with_items hands out per order) and the
+# OrderLineStore chunks it buffers lines in. All four are measured with
+# tracemalloc (traced memory still held once the representation is built).
+# Runs against a throwaway database, never db/restaurant.db.
+
+import argparse
+import os
+import random
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+from utils import db_utils
+from utils.line_store import iter_line_chunks
+
+ITEM_QUERY = """
+    SELECT oi.order_id, oi.item_id, m.name, oi.qty, oi.unit_price, oi.line_total
+    FROM order_items oi
+    JOIN menu m ON m.id = oi.item_id
+"""
+
+
+def build_db(n_lines, n_menu=200, lines_per_order=4):
+    db_utils.DB_PATH = os.path.join(tempfile.mkdtemp(), "line_store_bench.db")
+    db_utils.init_db()
+    conn = db_utils.get_connection()
+    conn.executemany(
+        "INSERT INTO menu (name, category, price, gst_percent) VALUES (?, ?, ?, 0.05)",
+        [(f"Menu Item {i}", "Food", float(random.randint(40, 400))) for i in range(n_menu)],
+    )
+    now = datetime.now().isoformat()
+    n_orders = n_lines // lines_per_order
+    conn.executemany(
+        "INSERT INTO orders (mode, subtotal, gst_amount, discount_amount, total_amount, payment_method, created_at) "
+        "VALUES ('DINE_IN', 0, 0, 0, 0, 'CASH', ?)",
+        [(now,)] * n_orders,
+    )
+    prices = dict(conn.execute("SELECT id, price FROM menu"))
+    lines = []
+    for i in range(n_lines):
+        item_id = random.randint(1, n_menu)
+        qty = random.randint(1, 5)
+        lines.append((i // lines_per_order + 1, item_id, qty, prices[item_id], prices[item_id] * qty))
+    conn.executemany(
+        "INSERT INTO order_items (order_id, item_id, qty, unit_price, line_total) VALUES (?, ?, ?, ?, ?)",
+        lines,
+    )
+    conn.commit()
+    conn.close()
+
+
+def measure(load):
+    """Return (retained bytes, line count) for whatever load() builds"""
+    tracemalloc.start()
+    obj = load()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, len(obj)
+
+
+def load_dataframe():
+    conn = db_utils.get_connection()
+    df = pd.read_sql(ITEM_QUERY, conn)
+    conn.close()
+    return df
+
+
+def load_dicts():
+    conn = db_utils.get_connection()
+    rows = [
+        {"order_id": r[0], "item_id": r[1], "name": r[2], "qty": int(r[3]),
+         "unit_price": float(r[4]), "line_total": float(r[5])}
+        for r in conn.execute(ITEM_QUERY)
+    ]
+    conn.close()
+    return rows
+
+
+class StoreChunks(list):
+    """List of OrderLineStore chunks whose len() is the total number of lines"""
+    def __len__(self):
+        return sum(len(chunk) for chunk in self)
+
+
+def load_chunks():
+    conn = db_utils.get_connection()
+    chunks = StoreChunks(iter_line_chunks(conn.execute(ITEM_QUERY)))
+    conn.close()
+    return chunks
+
+
+def load_order_lines():
+    lines = []
+    for chunk in load_chunks():
+        lines.extend(chunk.lines())
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark memory of order-line representations.")
+    parser.add_argument("--lines", type=int, default=500000)
+    args = parser.parse_args()
+
+    print(f"Building synthetic database with {args.lines} lines...")
+    build_db(args.lines)
+
+    results = [
+        ("DataFrame", measure(load_dataframe)),
+        ("list of dicts", measure(load_dicts)),
+        ("list of OrderLine", measure(load_order_lines)),
+        ("OrderLineStore", measure(load_chunks)),
+    ]
+    for label, (size, count) in results:
+        print(f"  {label:<18} {size / 1e6:8.1f} MB | {size / count:6.1f} bytes/line")
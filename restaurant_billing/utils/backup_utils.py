@@ -0,0 +1,132 @@
+# utils/backup_utils.py
+
+import glob
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from utils import db_utils
+
+BACKUP_DIR = "backups"
+SNAPSHOT_PREFIX = "restaurant_"
+PRE_RESTORE_PREFIX = "prerestore_"
+
+
+# ---------------------------
+# INTEGRITY
+# ---------------------------
+def check_integrity(path):
+    """Return True if PRAGMA integrity_check reports 'ok' for the database at path"""
+    conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+    try:
+        result = conn.execute("PRAGMA integrity_check").fetchall()
+    finally:
+        conn.close()
+    return result == [("ok",)]
+
+
+# ---------------------------
+# SNAPSHOTS
+# ---------------------------
+def _remove_db_file(path):
+    """Delete a database file together with any -wal/-shm sidecars"""
+    for p in (path, path + "-wal", path + "-shm"):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def list_snapshots(backup_dir=BACKUP_DIR, prefix=SNAPSHOT_PREFIX):
+    """
+    Return snapshot paths in backup_dir, oldest first.
+    Pass prefix=PRE_RESTORE_PREFIX to list the copies saved by restore_db instead.
+    """
+    return sorted(glob.glob(os.path.join(backup_dir, f"{prefix}*.db")))
+
+
+def prune_snapshots(keep, backup_dir=BACKUP_DIR):
+    """Delete all but the newest `keep` snapshots and return the removed paths"""
+    snapshots = list_snapshots(backup_dir)
+    removed = snapshots[:-keep] if keep > 0 else []
+    for path in removed:
+        _remove_db_file(path)
+    return removed
+
+
+def backup_db(backup_dir=BACKUP_DIR, pages=256, pause=0.005, keep=7, prefix=SNAPSHOT_PREFIX):
+    """
+    Take an online snapshot of the live database.
+
+    The copy runs through SQLite's backup API `pages` pages at a time with a
+    short `pause` between steps. The source is in WAL mode and the whole copy
+    happens inside one read transaction, so the snapshot is consistent and
+    cashier writes keep committing while it runs.
+
+    The snapshot is switched back to a rollback journal so it is a single
+    standalone file, and is integrity-checked before it is kept; afterwards
+    only the newest `keep` regular snapshots are retained (keep=0 keeps everything).
+
+    Returns:
+        str: Path to the new snapshot.
+    """
+    os.makedirs(backup_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    final_path = os.path.join(backup_dir, f"{prefix}{stamp}.db")
+    tmp_path = final_path + ".part"
+
+    try:
+        src = sqlite3.connect(db_utils.DB_PATH, isolation_level=None)
+        dst = sqlite3.connect(tmp_path)
+        try:
+            src.execute("PRAGMA journal_mode=WAL")
+            src.execute("BEGIN")
+            src.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            src.backup(dst, pages=pages, progress=lambda status, remaining, total: time.sleep(pause))
+            src.execute("COMMIT")
+            dst.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            dst.close()
+            src.close()
+    except BaseException:
+        _remove_db_file(tmp_path)
+        raise
+
+    if not check_integrity(tmp_path):
+        _remove_db_file(tmp_path)
+        raise RuntimeError("Snapshot failed integrity check")
+
+    os.replace(tmp_path, final_path)
+    _remove_db_file(tmp_path)
+    prune_snapshots(keep, backup_dir)
+    return final_path
+
+
+# ---------------------------
+# RESTORE
+# ---------------------------
+def restore_db(snapshot_path, backup_dir=BACKUP_DIR):
+    """
+    Replace the live database contents with a snapshot.
+
+    The snapshot is integrity-checked first, and the current database is
+    saved under PRE_RESTORE_PREFIX so the restore itself can be undone.
+    Those copies are not touched by list_snapshots/prune_snapshots rotation.
+
+    Returns:
+        str: Path to the pre-restore snapshot of the replaced database.
+    """
+    if not os.path.exists(snapshot_path):
+        raise FileNotFoundError(snapshot_path)
+    if not check_integrity(snapshot_path):
+        raise RuntimeError("Snapshot failed integrity check, not restoring")
+
+    previous = backup_db(backup_dir, keep=0, prefix=PRE_RESTORE_PREFIX)
+
+    src = sqlite3.connect(snapshot_path)
+    dst = sqlite3.connect(db_utils.DB_PATH)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+    return previous
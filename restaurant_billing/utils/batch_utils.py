@@ -0,0 +1,136 @@
+# utils/batch_utils.py
+
+import os
+import sqlite3
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from utils.db_utils import get_connection
+from utils.line_store import iter_line_chunks
+from utils.pdf_utils import generate_bill_pdf
+from utils.report_utils import generate_sales_report_pdf
+
+
+# ---------------------------
+# SET-BASED FETCH
+# ---------------------------
+def iter_orders_with_items(start_date: str, end_date: str, chunk_size: int = 10000):
+    """
+    Yield (order, lines) for every order between start_date and end_date (YYYY-MM-DD).
+    lines is a list of slotted OrderLine records (see utils/line_store.py).
+
+    Uses exactly two queries (orders, and all their lines) and merges them
+    on order_id while streaming. Lines are buffered chunk_size at a time in a
+    compact OrderLineStore and sliced out per order, so memory stays bounded.
+    """
+    conn = get_connection()
+    conn.row_factory = sqlite3.Row
+    order_cur = conn.execute("""
+        SELECT id, mode, subtotal, gst_amount, discount_amount,
+               total_amount, payment_method, created_at
+        FROM orders
+        WHERE DATE(created_at) BETWEEN ? AND ?
+        ORDER BY id
+    """, (start_date, end_date))
+    item_cur = conn.execute("""
+        SELECT oi.order_id, oi.item_id, m.name, oi.qty, oi.unit_price, oi.line_total
+        FROM order_items oi
+        JOIN orders o ON o.id = oi.order_id
+        JOIN menu m   ON m.id = oi.item_id
+        WHERE DATE(o.created_at) BETWEEN ? AND ?
+        ORDER BY oi.order_id, oi.id
+    """, (start_date, end_date))
+
+    try:
+        chunks = iter_line_chunks(item_cur, chunk_size)
+        chunk = next(chunks, None)
+        pos = 0
+        for row in order_cur:
+            order = dict(row)
+            lines = []
+            # An order's lines may straddle a chunk boundary, so keep pulling
+            # chunks until a line for a later order is seen.
+            while chunk is not None:
+                order_ids = chunk.order_ids
+                while pos < len(chunk) and order_ids[pos] < order["id"]:
+                    pos += 1
+                end = pos
+                while end < len(chunk) and order_ids[end] == order["id"]:
+                    end += 1
+                lines.extend(chunk.lines(pos, end))
+                pos = end
+                if pos < len(chunk):
+                    break
+                chunk = next(chunks, None)
+                pos = 0
+            yield order, lines
+    finally:
+        conn.close()
+
+
+# ---------------------------
+# PARALLEL RENDERING
+# ---------------------------
+def _render_bill(args):
+    """Worker entry point: render one bill and return its path."""
+    order, lines, save_dir = args
+    return generate_bill_pdf(order, [line.as_dict() for line in lines], save_dir=save_dir)
+
+
+def generate_bills_batch(start_date: str, end_date: str, save_dir="bills",
+                         workers=None, max_pending=64, zip_path=None,
+                         report_path=None):
+    """
+    Regenerate every bill PDF between two dates over a process pool.
+
+    At most max_pending orders are queued for the workers at once, so memory
+    stays bounded regardless of how many bills the range contains.
+    If zip_path is given, the PDFs are also collected into that ZIP archive.
+    If report_path is given, the sales report PDF is generated as well.
+
+    Returns:
+        dict: bills count, elapsed seconds and bills_per_sec for the bills alone,
+              plus report_elapsed seconds for the sales report.
+    """
+    os.makedirs(save_dir, exist_ok=True)
+    archive = zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) if zip_path else None
+    count = 0
+    report_elapsed = 0.0
+
+    def collect(done):
+        nonlocal count
+        for fut in done:
+            path = fut.result()
+            if archive is not None:
+                archive.write(path, arcname=os.path.basename(path))
+            count += 1
+
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            for order, lines in iter_orders_with_items(start_date, end_date):
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(pool.submit(_render_bill, (order, lines, save_dir)))
+            collect(wait(pending)[0])
+            elapsed = time.perf_counter() - start
+
+        if report_path:
+            report_start = time.perf_counter()
+            generate_sales_report_pdf(start_date, end_date, filename=report_path)
+            if archive is not None:
+                archive.write(report_path, arcname=os.path.basename(report_path))
+            report_elapsed = time.perf_counter() - report_start
+    finally:
+        if archive is not None:
+            archive.close()
+
+    return {
+        "bills": count,
+        "elapsed": elapsed,
+        "bills_per_sec": count / elapsed if elapsed > 0 else 0.0,
+        "report_elapsed": report_elapsed,
+    }
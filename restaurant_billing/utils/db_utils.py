@@ -33,6 +33,7 @@ def init_db(reset: bool = False):
             DROP TABLE IF EXISTS orders;
             DROP TABLE IF EXISTS order_items;
             DROP TABLE IF EXISTS menu;
+            DROP TABLE IF EXISTS kot_tickets;
         """)
 
     # Menu table
@@ -74,6 +75,25 @@ def init_db(reset: bool = False):
         )
     """)
 
+    # Kitchen order tickets (one per order line, routed to a station)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS kot_tickets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            order_id INTEGER,
+            order_item_id INTEGER,
+            item_name TEXT,
+            qty INTEGER,
+            station TEXT,
+            status TEXT DEFAULT 'NEW',
+            created_at TEXT,
+            acked_at TEXT,
+            bumped_at TEXT,
+            FOREIGN KEY(order_id) REFERENCES orders(id),
+            FOREIGN KEY(order_item_id) REFERENCES order_items(id)
+        )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_kot_station ON kot_tickets(station, id)")
+
     conn.commit()
     conn.close()
 
@@ -93,6 +113,20 @@ def insert_menu_items_from_csv(csv_path):
     conn.commit()
     conn.close()
 
+# ---------------------------
+# KITCHEN STATIONS
+# ---------------------------
+STATION_BY_CATEGORY = {
+    "Food": "grill",
+    "Snacks": "fryer",
+    "Beverages": "bar",
+}
+DEFAULT_STATION = "grill"
+
+def station_for(category):
+    """Return the kitchen station a menu category is prepared at"""
+    return STATION_BY_CATEGORY.get((category or "").strip(), DEFAULT_STATION)
+
 # ---------------------------
 # ORDER FLOW
 # ---------------------------
@@ -110,18 +144,18 @@ def begin_order(mode="DINE_IN"):
     return order_id
 
 def add_item(order_id, item_id, qty):
-    """Add item to order"""
+    """Add item to order and send a kitchen ticket to its station"""
     conn = get_connection()
     cur = conn.cursor()
 
     # Fetch item price
-    cur.execute("SELECT price FROM menu WHERE id=?", (item_id,))
+    cur.execute("SELECT name, category, price FROM menu WHERE id=?", (item_id,))
     row = cur.fetchone()
     if not row:
         conn.close()
         raise ValueError("Item not found")
 
-    unit_price = row[0]
+    name, category, unit_price = row
     line_total = unit_price * qty
 
     cur.execute("""
@@ -129,6 +163,12 @@ def add_item(order_id, item_id, qty):
         VALUES (?, ?, ?, ?, ?)
     """, (order_id, item_id, qty, unit_price, line_total))
 
+    # Same transaction, so the kitchen never sees a line that was not saved
+    cur.execute("""
+        INSERT INTO kot_tickets (order_id, order_item_id, item_name, qty, station, status, created_at)
+        VALUES (?, ?, ?, ?, ?, 'NEW', ?)
+    """, (order_id, cur.lastrowid, name, qty, station_for(category), datetime.now().isoformat()))
+
     conn.commit()
     conn.close()
 
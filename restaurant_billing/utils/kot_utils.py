@@ -0,0 +1,87 @@
+# utils/kot_utils.py
+
+import sqlite3
+from datetime import datetime
+
+from utils.db_utils import get_connection
+
+# Ticket lifecycle: NEW (sent) -> ACKED (seen by station) -> BUMPED (served)
+STATUS_NEW = "NEW"
+STATUS_ACKED = "ACKED"
+STATUS_BUMPED = "BUMPED"
+
+
+# ---------------------------
+# POLLING
+# ---------------------------
+def poll_station(station, after_id=0, limit=50):
+    """
+    Return (tickets, cursor) for a station.
+
+    tickets: up to `limit` tickets with id > after_id, oldest first.
+    cursor: id of the last ticket returned (pass it back as after_id next time).
+    """
+    conn = get_connection()
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute("""
+        SELECT id, order_id, order_item_id, item_name, qty, station, status, created_at
+        FROM kot_tickets
+        WHERE station=? AND id>?
+        ORDER BY id
+        LIMIT ?
+    """, (station, after_id, limit)).fetchall()
+    conn.close()
+
+    tickets = [dict(r) for r in rows]
+    cursor = tickets[-1]["id"] if tickets else after_id
+    return tickets, cursor
+
+
+def get_open_tickets(station):
+    """Return all tickets at a station that have not been bumped yet"""
+    conn = get_connection()
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute("""
+        SELECT id, order_id, item_name, qty, status, created_at
+        FROM kot_tickets
+        WHERE station=? AND status!=?
+        ORDER BY id
+    """, (station, STATUS_BUMPED)).fetchall()
+    conn.close()
+    return [dict(r) for r in rows]
+
+
+# ---------------------------
+# STATE CHANGES
+# ---------------------------
+def ack_tickets(ticket_ids):
+    """Mark a batch of NEW tickets as acknowledged by the station"""
+    if not ticket_ids:
+        return 0
+    conn = get_connection()
+    cur = conn.cursor()
+    now = datetime.now().isoformat()
+    cur.executemany("""
+        UPDATE kot_tickets SET status=?, acked_at=?
+        WHERE id=? AND status=?
+    """, [(STATUS_ACKED, now, tid, STATUS_NEW) for tid in ticket_ids])
+    conn.commit()
+    count = cur.rowcount
+    conn.close()
+    return count
+
+
+def bump_ticket(ticket_id):
+    """Mark a ticket as done and remove it from the station display"""
+    conn = get_connection()
+    cur = conn.cursor()
+    now = datetime.now().isoformat()
+    cur.execute("""
+        UPDATE kot_tickets
+        SET status=?, bumped_at=?, acked_at=COALESCE(acked_at, ?)
+        WHERE id=? AND status!=?
+    """, (STATUS_BUMPED, now, now, ticket_id, STATUS_BUMPED))
+    conn.commit()
+    changed = cur.rowcount > 0
+    conn.close()
+    return changed
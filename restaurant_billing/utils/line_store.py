@@ -0,0 +1,102 @@
+# utils/line_store.py
+
+from array import array
+
+
+# ---------------------------
+# PER-LINE RECORD
+# ---------------------------
+class OrderLine:
+    """One order line, as handed out by OrderLineStore (money in paise)"""
+    __slots__ = ("order_id", "item_id", "name", "qty", "unit_paise", "line_paise")
+
+    def __init__(self, order_id, item_id, name, qty, unit_paise, line_paise):
+        self.order_id = order_id
+        self.item_id = item_id
+        self.name = name
+        self.qty = qty
+        self.unit_paise = unit_paise
+        self.line_paise = line_paise
+
+    def as_dict(self):
+        """Return the line in the dict shape used by pdf_utils.generate_bill_pdf"""
+        return {
+            "name": self.name,
+            "qty": self.qty,
+            "unit_price": self.unit_paise / 100,
+            "line_total": self.line_paise / 100,
+        }
+
+
+def to_paise(amount):
+    """Convert a rupee amount (float) to integer paise"""
+    return int(round((amount or 0.0) * 100))
+
+
+# ---------------------------
+# COLUMNAR STORE
+# ---------------------------
+class OrderLineStore:
+    """
+    Struct-of-arrays store for order lines.
+
+    Ids, quantities and amounts (in paise) live in typed arrays; item names
+    are stored once in `names` and referenced by an integer code per line.
+    """
+
+    def __init__(self):
+        self.order_ids = array("q")
+        self.item_ids = array("q")
+        self.qtys = array("q")
+        self.unit_paise = array("q")
+        self.line_paise = array("q")
+        self.name_codes = array("i")
+        self.names = []
+        self._name_index = {}
+
+    def __len__(self):
+        return len(self.order_ids)
+
+    def __getitem__(self, i):
+        return OrderLine(
+            self.order_ids[i], self.item_ids[i], self.names[self.name_codes[i]],
+            self.qtys[i], self.unit_paise[i], self.line_paise[i],
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, order_id, item_id, name, qty, unit_price, line_total):
+        """Add one line (prices in rupees, as stored in SQLite)"""
+        code = self._name_index.get(name)
+        if code is None:
+            code = len(self.names)
+            self._name_index[name] = code
+            self.names.append(name)
+        self.order_ids.append(order_id)
+        self.item_ids.append(item_id)
+        self.qtys.append(int(qty or 0))
+        self.unit_paise.append(to_paise(unit_price))
+        self.line_paise.append(to_paise(line_total))
+        self.name_codes.append(code)
+
+    def lines(self, start=0, stop=None):
+        """Return OrderLine records for positions start..stop (a per-order slice)"""
+        stop = len(self) if stop is None else stop
+        return [self[i] for i in range(start, stop)]
+
+
+def iter_line_chunks(cursor, chunk_size: int = 10000):
+    """
+    Yield one OrderLineStore per chunk_size rows of an order-line cursor.
+    The cursor must return (order_id, item_id, name, qty, unit_price, line_total).
+    """
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        store = OrderLineStore()
+        for row in rows:
+            store.append(*row)
+        yield store